@@ -5,10 +5,7 @@ import os
 import sys
 
 from xcode_optimise.detection import find_xcode_project_path, is_xcode_project
-from xcode_optimise.localization import (
-    get_development_region,
-    list_localization_languages,
-)
+from xcode_optimise.localization import parse_regions
 
 
 def main() -> None:
@@ -37,11 +34,9 @@ def main() -> None:
             sys.exit(1)
 
         try:
-            # Get the default development region
-            default_name, default_code = get_development_region(project_path)
-
-            # Get all known regions
-            languages = list_localization_languages(project_path)
+            # Get the default development region and all known regions,
+            # reading project.pbxproj only once
+            (default_name, default_code), languages = parse_regions(project_path)
 
             # Print the default language on the first line
             if default_code:
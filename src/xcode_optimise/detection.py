@@ -1,70 +1,292 @@
 """Xcode project detection utilities."""
 
+import functools
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Final
 
+_XCODEPROJ_SUFFIX: Final = ".xcodeproj"
+_PROJECT_SUFFIXES: Final = (".xcodeproj", ".xcworkspace")
 
-def is_xcode_project(directory_path: str) -> bool:
+# Bundles are directories on disk but never contain a project of their own
+_BUNDLE_SUFFIXES: Final = (".xcodeproj", ".xcworkspace", ".framework", ".bundle")
+
+# Projects live close to the repository root; deeper directories are
+# almost always build or dependency artifacts
+_MAX_DEPTH: Final = 4
+
+# Build output and dependency checkouts that never hold the project itself
+_SKIPPED_DIRS: Final = frozenset(
+    {"build", "DerivedData", "Pods", "Carthage", "node_modules"}
+)
+
+# Parallel searches fall back to a single thread when the top level has no
+# more subdirectories than this, since thread start-up would dominate
+_PARALLEL_THRESHOLD: Final = 8
+
+
+def _is_pruned(dir_name: str) -> bool:
     """
-    Check if a directory corresponds to an Xcode project.
+    Check whether a directory should be skipped when searching for projects.
 
-    First checks the immediate directory for .xcodeproj or .xcworkspace bundles.
-    If not found, recursively searches subdirectories.
+    Hidden directories (.git, .build, ...), build and dependency directories
+    (build, DerivedData, Pods, Carthage, node_modules) and bundles such as
+    .xcodeproj, .xcworkspace, .framework or .bundle never hold a project worth
+    reporting, but can contain many internal directories.
 
     Args:
-        directory_path: Path to the directory to check
+        dir_name: Name of the directory entry
 
     Returns:
-        True if .xcodeproj or .xcworkspace is found, False otherwise
+        True if the directory should not be descended into, False otherwise
+    """
+    return (
+        dir_name.startswith(".")
+        or dir_name in _SKIPPED_DIRS
+        or dir_name.endswith(_BUNDLE_SUFFIXES)
+    )
+
+
+def _is_bundle_dir(entry: os.DirEntry[str]) -> bool:
     """
-    path = Path(directory_path)
+    Check whether a name-matched entry is a directory, following symlinks.
+
+    Symlinked bundles count as matches. A link that cannot be resolved (a
+    loop, a missing target, no permission) is not a match, as with os.walk.
+
+    Args:
+        entry: Directory entry whose name ends with a wanted suffix
 
-    if not path.exists() or not path.is_dir():
+    Returns:
+        True if the entry is, or links to, a directory, False otherwise
+    """
+    try:
+        return entry.is_dir()
+    except OSError:
         return False
 
-    # Check immediate directory first
-    for item in path.iterdir():
-        if item.is_dir() and item.suffix in [".xcodeproj", ".xcworkspace"]:
-            return True
 
-    # If not found, search recursively
-    for _root, dirs, _files in os.walk(directory_path):
-        for dir_name in dirs:
-            if dir_name.endswith((".xcodeproj", ".xcworkspace")):
-                return True
+def _search(
+    pending: deque[tuple[str, int]],
+    suffixes: str | tuple[str, ...],
+    stop: threading.Event | None = None,
+) -> str | None:
+    """
+    Search breadth-first from the queued directories for a matching bundle.
 
-    return False
+    Each directory is listed exactly once, and the search stops at the first
+    match. Directories more than _MAX_DEPTH levels below the search root, or
+    rejected by _is_pruned, are not listed.
 
+    Args:
+        pending: Queue of (directory path, depth below the search root) pairs
+        suffixes: Bundle suffix, or tuple of suffixes, to look for
+        stop: Event that, once set, abandons the search
 
-def find_xcode_project_path(directory_path: str) -> Path | None:
+    Returns:
+        Path to the matching bundle, as built by os.scandir, if found, None
+        otherwise
     """
-    Find and return the path to the .xcodeproj bundle in the given directory.
+    # DirEntry.is_dir() usually reuses the file type reported by the directory
+    # listing, so classifying an entry rarely costs an extra stat call.
+    while pending:
+        if stop is not None and stop.is_set():
+            return None
+        current, depth = pending.popleft()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            # Missing, non-directory or unreadable paths are skipped, as
+            # os.walk would do; for the search root this yields None
+            # without a separate exists()/is_dir() stat beforehand
+            continue
+        with entries:
+            for entry in entries:
+                # Name checks are plain string operations, so they run before
+                # is_dir(), which may need a stat when d_type is unavailable.
+                # Symlinked bundles count as matches, as with os.walk, but
+                # symlinked directories are never descended into.
+                name = entry.name
+                if name.endswith(suffixes):
+                    if _is_bundle_dir(entry):
+                        return entry.path
+                elif (
+                    depth < _MAX_DEPTH
+                    and not _is_pruned(name)
+                    and entry.is_dir(follow_symlinks=False)
+                ):
+                    pending.append((entry.path, depth + 1))
 
-    First checks the immediate directory for .xcodeproj bundles.
-    If not found, recursively searches subdirectories.
+    return None
+
+
+def _search_parallel(
+    directory_path: str, suffixes: str | tuple[str, ...]
+) -> str | None:
+    """
+    Search each top-level subdirectory of a directory on its own thread.
+
+    Directory listing releases the GIL, so independent subtrees can be read
+    concurrently. The first thread to find a match wins, which means the
+    result is not necessarily the shallowest match when there are several.
 
     Args:
         directory_path: Path to the directory to search
+        suffixes: Bundle suffix, or tuple of suffixes, to look for
 
     Returns:
-        Path to the .xcodeproj bundle if found, None otherwise
+        Path to the matching bundle, as built by os.scandir, if found, None
+        otherwise
     """
-    path = Path(directory_path)
+    subdirs: list[str] = []
+    try:
+        entries = os.scandir(directory_path)
+    except OSError:
+        return None
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith(suffixes):
+                if _is_bundle_dir(entry):
+                    return entry.path
+            elif not _is_pruned(name) and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+
+    if len(subdirs) <= _PARALLEL_THRESHOLD:
+        return _search(deque((subdir, 1) for subdir in subdirs), suffixes)
 
-    if not path.exists() or not path.is_dir():
+    stop = threading.Event()
+    max_workers = min(len(subdirs), 32, (os.cpu_count() or 1) * 4)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(_search, deque([(subdir, 1)]), suffixes, stop)
+            for subdir in subdirs
+        ]
+        for future in as_completed(futures):
+            found = future.result()
+            if found is not None:
+                return found
         return None
+    finally:
+        # Abandon queued subtrees and let running ones exit at their next step
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
 
-    # Check immediate directory first
-    for item in path.iterdir():
-        if item.is_dir() and item.suffix == ".xcodeproj":
-            return item
 
-    # If not found, search recursively
-    for root, dirs, _files in os.walk(directory_path):
-        for dir_name in dirs:
-            if dir_name.endswith(".xcodeproj"):
-                return Path(root) / dir_name
+@functools.lru_cache(maxsize=128)
+def _find_bundle_cached(
+    search_root: str, suffixes: str | tuple[str, ...], parallel: bool
+) -> str | None:
+    """
+    Memoized bundle search over a directory given as an absolute path.
 
-    return None
+    Args:
+        search_root: Absolute path of the directory to search; it is used
+            as given, so the cache never names a different directory than
+            the one searched
+        suffixes: Bundle suffix, or tuple of suffixes, to look for
+        parallel: Search top-level subdirectories concurrently
+
+    Returns:
+        Path of the matching bundle if found, None otherwise. Paths built by
+        os.scandir extend search_root, so it is always a prefix of the result.
+    """
+    if parallel:
+        return _search_parallel(search_root, suffixes)
+    return _search(deque([(search_root, 0)]), suffixes)
+
+
+def _find_bundle(
+    directory_path: str, suffixes: str | tuple[str, ...], parallel: bool = False
+) -> Path | None:
+    """
+    Find the first bundle directory whose name ends with one of the given suffixes.
 
+    The tree is searched breadth-first, so the shallowest match wins, and the
+    search stops at the first match. Each directory is listed exactly once.
+    Directories more than _MAX_DEPTH levels below directory_path, or rejected
+    by _is_pruned, are not listed.
 
+    Results are cached per absolute directory path, so a relative path and
+    the same path joined onto the working directory share one entry; see
+    clear_cache.
+
+    Args:
+        directory_path: Path to the directory to search
+        suffixes: Bundle suffix, or tuple of suffixes, to look for
+        parallel: Search top-level subdirectories concurrently
+
+    Returns:
+        Path to the matching bundle if found, None otherwise
+    """
+    # Relative paths are only joined onto the working directory, never
+    # normalized: collapsing '..' by string rules could name another
+    # directory when a component is a symlink. No stat calls are made.
+    if os.path.isabs(directory_path):
+        search_root = directory_path
+    else:
+        search_root = os.path.join(os.getcwd(), directory_path)
+
+    found = _find_bundle_cached(search_root, suffixes, parallel)
+    if found is None:
+        return None
+    # Rebuild the result on the caller's spelling of the directory, so it is
+    # the path a search started from directory_path would have produced
+    return Path(directory_path + found[len(search_root) :])
+
+
+def is_xcode_project(directory_path: str, *, parallel: bool = False) -> bool:
+    """
+    Check if a directory corresponds to an Xcode project.
+
+    First checks the immediate directory for .xcodeproj or .xcworkspace bundles.
+    If not found, searches subdirectories breadth-first up to a few levels
+    deep, skipping hidden, build, dependency and bundle directories.
+    Results are cached; call clear_cache() if the directory may have changed.
+
+    Args:
+        directory_path: Path to the directory to check
+        parallel: Search top-level subdirectories on a thread pool, which
+            helps on monorepos with many sibling folders
+
+    Returns:
+        True if .xcodeproj or .xcworkspace is found, False otherwise
+    """
+    return _find_bundle(directory_path, _PROJECT_SUFFIXES, parallel) is not None
+
+
+def find_xcode_project_path(
+    directory_path: str, *, parallel: bool = False
+) -> Path | None:
+    """
+    Find and return the path to the .xcodeproj bundle in the given directory.
+
+    First checks the immediate directory for .xcodeproj bundles.
+    If not found, searches subdirectories breadth-first up to a few levels
+    deep, skipping hidden, build, dependency and bundle directories.
+    Results are cached; call clear_cache() if the directory may have changed.
+
+    Args:
+        directory_path: Path to the directory to search
+        parallel: Search top-level subdirectories on a thread pool, which
+            helps on monorepos with many sibling folders. When several
+            projects exist, any one of them may be returned.
+
+    Returns:
+        Path to the .xcodeproj bundle if found, None otherwise
+    """
+    return _find_bundle(directory_path, _XCODEPROJ_SUFFIX, parallel)
+
+
+def clear_cache() -> None:
+    """
+    Forget the results of earlier is_xcode_project and find_xcode_project_path calls.
+
+    Both functions cache their results for the lifetime of the process. Call
+    this when the file system may have changed since a directory was searched.
+    """
+    _find_bundle_cached.cache_clear()
@@ -1,15 +1,52 @@
 """Language and localization utilities for Xcode projects."""
 
+import functools
+import mmap
+import os
 import re
+from collections.abc import Callable
 from pathlib import Path
 
-from babel import Locale
+from babel import Locale, UnknownLocaleError
 
+_DEVELOPMENT_REGION_RE = re.compile(rb"developmentRegion\s*=\s*([^;]+);")
+_KNOWN_REGIONS_RE = re.compile(rb"knownRegions\s*=\s*\((.*?)\);", re.DOTALL)
 
+# developmentRegion sits near the top of project.pbxproj, so it is read in
+# blocks of this size until a match is found
+_READ_CHUNK_SIZE = 64 * 1024
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_base_language_name(base_code: str) -> str | None:
+    """
+    Convert a bare language code to a human-readable language name using babel.Locale.
+
+    Memoized separately from _get_language_name, so regional variants that
+    fail to parse in full (e.g., 'zh-Hans-XX', 'zh-Hant-YY') share one lookup
+    of their base language.
+
+    Args:
+        base_code: Language code without script or region (e.g., 'zh')
+
+    Returns:
+        Language name (e.g., 'Chinese') or None if parsing fails
+    """
+    try:
+        locale = Locale.parse(base_code)
+        return locale.get_display_name("en")
+    except (ValueError, AttributeError, UnknownLocaleError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
 def _get_language_name(code: str) -> str | None:
     """
     Convert a language code to a human-readable language name using babel.Locale.
 
+    Results are memoized, since the same codes show up in both
+    developmentRegion and knownRegions.
+
     Args:
         code: Language code (e.g., 'en', 'fr', 'en-US')
 
@@ -19,25 +56,78 @@ def _get_language_name(code: str) -> str | None:
     try:
         locale = Locale.parse(code, sep="-")
         return locale.get_display_name("en")
-    except (ValueError, AttributeError):
-        try:
-            base_code = code.split("-")[0].split("_")[0]
-            locale = Locale.parse(base_code)
-            return locale.get_display_name("en")
-        except (ValueError, AttributeError):
-            return None
+    except (ValueError, AttributeError, UnknownLocaleError):
+        return _get_base_language_name(code.split("-", 1)[0].split("_", 1)[0])
 
 
-def get_development_region(project_path: Path) -> tuple[str | None, str]:
+def _match_development_region(content: bytes | mmap.mmap) -> bytes | None:
     """
-    Extract the development region (default language) from an Xcode project's project.pbxproj file.
+    Find the raw developmentRegion value in project.pbxproj contents.
+
+    Args:
+        content: Read-only mapping of project.pbxproj, or a chunk read from it
+
+    Returns:
+        The bytes assigned to developmentRegion, or None if not found
+    """
+    # The regex only runs from the keyword's first occurrence, found with a
+    # plain substring scan; no match can start any earlier
+    start = content.find(b"developmentRegion")
+    if start < 0:
+        return None
+
+    match = _DEVELOPMENT_REGION_RE.search(content, start)
+    return match.group(1) if match else None
+
+
+def _match_known_regions(content: mmap.mmap) -> bytes | None:
+    """
+    Find the body of the knownRegions list in a mapped project.pbxproj file.
+
+    The list has the fixed shape `knownRegions = ( ... );`, so its delimiters
+    are located with plain substring scans. Anything unexpected around the
+    first occurrence of the keyword falls back to the regex.
+
+    Args:
+        content: Read-only mapping of project.pbxproj
+
+    Returns:
+        The bytes between the parentheses of knownRegions, or None if not found
+    """
+    start = content.find(b"knownRegions")
+    if start < 0:
+        return None
+
+    open_paren = content.find(b"(", start)
+    # Only whitespace and '=' may separate the keyword from its list; the
+    # distance bound keeps a stray occurrence from slicing a large span
+    if (
+        0 <= open_paren - start <= 64
+        and content[start + len(b"knownRegions") : open_paren].strip() == b"="
+    ):
+        close_paren = content.find(b");", open_paren + 1)
+        if close_paren >= 0:
+            return content[open_paren + 1 : close_paren]
+
+    match = _KNOWN_REGIONS_RE.search(content, start)
+    return match.group(1) if match else None
+
+
+def _search_pbxproj(
+    project_path: Path, *matchers: Callable[[mmap.mmap], bytes | None]
+) -> list[bytes | None]:
+    """
+    Run each of the given matchers over an Xcode project's project.pbxproj file.
+
+    The file is opened once and searched through a read-only memory mapping,
+    so it is neither copied nor decoded as a whole.
 
     Args:
         project_path: Path to the .xcodeproj bundle
+        matchers: Functions extracting a value from the mapped file
 
     Returns:
-        Tuple containing (language_name, language_code) for the development region
-        (e.g., ('English', 'en')). If not found or parsing fails, returns (None, '') or (None, <code>).
+        The value found by each matcher, or None where a matcher found nothing
 
     Raises:
         FileNotFoundError: If project.pbxproj file is not found
@@ -49,18 +139,27 @@ def get_development_region(project_path: Path) -> tuple[str | None, str]:
         raise FileNotFoundError(f"project.pbxproj not found in {project_path}")
 
     try:
-        with open(pbxproj_path, encoding="utf-8") as f:
-            content = f.read()
+        with open(pbxproj_path, "rb") as f:
+            # Empty files cannot be mapped, and contain nothing to match
+            if not os.fstat(f.fileno()).st_size:
+                return [None] * len(matchers)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return [matcher(content) for matcher in matchers]
     except OSError as e:
         raise OSError(f"Failed to read project.pbxproj: {e}") from e
 
-    pattern = r"developmentRegion\s*=\s*([^;]+);"
-    match = re.search(pattern, content)
 
-    if not match:
-        return (None, "")
+def _parse_development_region(value: str) -> tuple[str | None, str]:
+    """
+    Convert a raw developmentRegion value into a (language_name, language_code) pair.
+
+    Args:
+        value: Text assigned to developmentRegion, possibly quoted
 
-    code = match.group(1).strip().strip("'\"")
+    Returns:
+        Tuple containing (language_name, language_code), or (None, '') if empty
+    """
+    code = value.strip().strip("'\"")
     if not code:
         return (None, "")
 
@@ -68,16 +167,33 @@ def get_development_region(project_path: Path) -> tuple[str | None, str]:
     return (language_name, code)
 
 
-def list_localization_languages(project_path: Path) -> list[tuple[str | None, str]]:
+def _parse_known_regions(regions_content: str) -> list[tuple[str | None, str]]:
     """
-    Extract all localization languages from an Xcode project's project.pbxproj file.
+    Convert the body of a knownRegions list into (language_name, language_code) pairs.
 
     Args:
-        project_path: Path to the .xcodeproj bundle
+        regions_content: Text between the parentheses of knownRegions
 
     Returns:
         List of tuples containing (language_name, language_code) pairs
-        (e.g., [('English', 'en'), ('French', 'fr'), ('German', 'de')])
+    """
+    return [
+        (_get_language_name(code), code)
+        for line in regions_content.splitlines()
+        if (code := line.strip(" \t\r\f\v,'\"")) and not code.startswith("//")
+    ]
+
+
+def get_development_region(project_path: Path) -> tuple[str | None, str]:
+    """
+    Extract the development region (default language) from an Xcode project's project.pbxproj file.
+
+    Args:
+        project_path: Path to the .xcodeproj bundle
+
+    Returns:
+        Tuple containing (language_name, language_code) for the development region
+        (e.g., ('English', 'en')). If not found or parsing fails, returns (None, '') or (None, <code>).
 
     Raises:
         FileNotFoundError: If project.pbxproj file is not found
@@ -88,30 +204,90 @@ def list_localization_languages(project_path: Path) -> list[tuple[str | None, st
     if not pbxproj_path.exists():
         raise FileNotFoundError(f"project.pbxproj not found in {project_path}")
 
+    # Read raw bytes: the file is ASCII outside of comments, so only the
+    # matched value is decoded rather than every chunk
+    value = None
     try:
-        with open(pbxproj_path, encoding="utf-8") as f:
-            content = f.read()
+        with open(pbxproj_path, "rb") as f:
+            pending = b""
+            while chunk := f.read(_READ_CHUNK_SIZE):
+                content = pending + chunk
+                value = _match_development_region(content)
+                if value is not None:
+                    break
+                # A match completed by a later chunk cannot contain a ';', so
+                # only the text after the last one needs to be carried over
+                pending = content[content.rfind(b";") + 1 :]
     except OSError as e:
         raise OSError(f"Failed to read project.pbxproj: {e}") from e
 
-    pattern = r"knownRegions\s*=\s*\((.*?)\);"
-    match = re.search(pattern, content, re.DOTALL)
+    if value is None:
+        return (None, "")
+
+    return _parse_development_region(value.decode("ascii", "replace"))
+
+
+def list_localization_languages(project_path: Path) -> list[tuple[str | None, str]]:
+    """
+    Extract all localization languages from an Xcode project's project.pbxproj file.
+
+    Args:
+        project_path: Path to the .xcodeproj bundle
 
-    if not match:
+    Returns:
+        List of tuples containing (language_name, language_code) pairs
+        (e.g., [('English', 'en'), ('French', 'fr'), ('German', 'de')])
+
+    Raises:
+        FileNotFoundError: If project.pbxproj file is not found
+        OSError: If project.pbxproj file cannot be read
+    """
+    # knownRegions sits deep in the file, so it is located in a read-only
+    # mapping instead of a decoded copy; only the matched block is decoded
+    (regions_block,) = _search_pbxproj(project_path, _match_known_regions)
+
+    if regions_block is None:
         return []
 
-    regions_content = match.group(1)
-    language_codes: list[str] = []
-    for line in regions_content.split("\n"):
-        line = line.strip().rstrip(",")
-        if line and not line.startswith("//"):
-            lang = line.strip("'\"")
-            if lang:
-                language_codes.append(lang)
-
-    languages = []
-    for code in language_codes:
-        language_name = _get_language_name(code)
-        languages.append((language_name, code))
-
-    return languages
+    return _parse_known_regions(regions_block.decode("ascii", "replace"))
+
+
+def parse_regions(
+    project_path: Path,
+) -> tuple[tuple[str | None, str], list[tuple[str | None, str]]]:
+    """
+    Extract both the development region and all localization languages at once.
+
+    Equivalent to calling get_development_region and list_localization_languages,
+    but project.pbxproj is opened and scanned only once.
+
+    Args:
+        project_path: Path to the .xcodeproj bundle
+
+    Returns:
+        Tuple of (development_region, languages), where development_region is a
+        (language_name, language_code) pair as returned by get_development_region
+        and languages is a list as returned by list_localization_languages
+
+    Raises:
+        FileNotFoundError: If project.pbxproj file is not found
+        OSError: If project.pbxproj file cannot be read
+    """
+    development_region, regions_block = _search_pbxproj(
+        project_path, _match_development_region, _match_known_regions
+    )
+
+    default: tuple[str | None, str]
+    if development_region is None:
+        default = (None, "")
+    else:
+        default = _parse_development_region(
+            development_region.decode("ascii", "replace")
+        )
+
+    if regions_block is None:
+        languages = []
+    else:
+        languages = _parse_known_regions(regions_block.decode("ascii", "replace"))
+
+    return (default, languages)